@@ -1,34 +1,33 @@
 import json
+import mmap
 import re
 import urllib.request
 from pathlib import Path
 
 from packaging.version import parse
 
-try:
-    from importlib.metadata import version
-except ImportError:
-    # noinspection PyUnresolvedReferences,PyUnresolvedReferences
-    from importlib_metadata import version
-
-from distutils.version import LooseVersion
+version_pattern = re.compile(rb"__version__ *= *'(.*?)'")
 
 
 def read_version():
     try:
-        v = [x for x in Path('rumydata/__init__.py').open() if x.startswith('__version__')][0]
-        v = re.match(r"__version__ *= *'(.*?)'\n", v)[1]
-        return v
+        with Path('rumydata/__init__.py').open('rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return version_pattern.search(mm)[1].decode()
     except Exception as e:
         raise RuntimeError(f"Unable to read version string: {e}")
 
 
+def fetch_releases(url):
+    with urllib.request.urlopen(url) as response:
+        return json.load(response)['releases']
+
+
 pypi_url = f'https://pypi.org/pypi/rumydata/json'
-response = urllib.request.urlopen(pypi_url).read().decode()
-latest_version = max(LooseVersion(s) for s in json.loads(response)['releases'].keys())
+latest_version = max(map(parse, fetch_releases(pypi_url).keys()))
 setup_version = read_version()
 
-if parse(setup_version) > parse(str(latest_version)):
+if parse(setup_version) > latest_version:
     print(f'PASS: version {setup_version} exceeds latest published, {latest_version}')
 else:
     raise Exception(f'FAIL: version {setup_version} does not exceed latest published {latest_version}')
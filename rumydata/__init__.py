@@ -29,10 +29,36 @@ format (e.g. csv), but can be used to validate Excel spreadsheets by installing
 the `openpyxl` package.
 """
 
-from rumydata import exception
-from rumydata import field
-from rumydata import rules
+from importlib import import_module as _import_module
+
 from rumydata.menu import menu
-from rumydata.table import *
 
 __version__ = '1.4.3'
+
+# submodules and objects are only imported the first time they are accessed
+_lazy = {
+    'exception': 'rumydata.exception',
+    'field': 'rumydata.field',
+    'rules': 'rumydata.rules',
+    'table': 'rumydata.table',
+    'Layout': 'rumydata.table',
+    'CsvFile': 'rumydata.table',
+    'ExcelFile': 'rumydata.table',
+    'ParquetFile': 'rumydata.table'
+}
+
+__all__ = ['menu', *_lazy]
+
+
+def __getattr__(name):
+    try:
+        module = _import_module(_lazy[name])
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = module if module.__name__ == f'{__name__}.{name}' else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted((set(globals()) | set(__all__)) - {'_import_module', '_lazy'})
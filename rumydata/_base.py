@@ -5,7 +5,7 @@ This submodule contains the base objects that are used by other modules in this
 package. This is not intended for use by end-users.
 """
 
-from typing import List, Union
+from typing import Callable, List, Tuple, Union
 
 import rumydata
 from rumydata.exception import UrNotMyDataError
@@ -19,6 +19,7 @@ class _BaseRule:
     the rule types contained in the rules submodule.
     """
     _default_args = tuple()  # a default set of positional args for testing
+    _evaluator_cache = None
 
     def __init__(self):
         pass
@@ -40,7 +41,13 @@ class _BaseRule:
 
     @classmethod
     def rule_exception(cls):
-        return type(f'{cls.__name__}Error', (UrNotMyDataError,), {})
+        # generated once per rule class, and stored on that class (rather than
+        # in a global cache) so that it does not outlive the rule class
+        exception = cls.__dict__.get('_rule_exception')
+        if exception is None:
+            exception = type(f'{cls.__name__}Error', (UrNotMyDataError,), {})
+            cls._rule_exception = exception
+        return exception
 
     def _prepare(self, data) -> tuple:
         """
@@ -83,6 +90,26 @@ class _BaseRule:
         """
         return lambda x: False  # default to failing evaluation if not overwritten
 
+    @property
+    def _cached_evaluator(self):
+        """
+        Evaluator function, generated once per rule instance
+
+        The function returned by the evaluator method is built on first access
+        and reused on every following check, rather than being rebuilt for
+        each value that is checked.
+        """
+        if self._evaluator_cache is None:
+            self._evaluator_cache = self._evaluator()
+        return self._evaluator_cache
+
+    def __getstate__(self):
+        # the cached evaluator is a local function, which cannot be pickled, and
+        # which would remain bound to this rule in a copy; it is rebuilt on use
+        state = self.__dict__.copy()
+        state.pop('_evaluator_cache', None)
+        return state
+
     def _exception_msg(self) -> UrNotMyDataError:
         """
         Validation exception message
@@ -93,6 +120,23 @@ class _BaseRule:
         """
         return self.rule_exception()(self._explain())
 
+    def _raised_exception_msg(self, error: Exception, debug=False) -> UrNotMyDataError:
+        """
+        Raised exception message
+
+        Generates an exception from the rule_exception method which reports that
+        an error was raised while evaluating this rule. Only the type of the
+        raised error is reported, since its message might contain the data that
+        was being evaluated, unless debug mode is enabled.
+
+        :param error: the exception raised while evaluating this rule.
+        :param debug: whether to include the message of the raised exception.
+        """
+        msg = f'raised {error.__class__.__name__} while checking if value {self._explain()}'
+        if debug:
+            msg += f' [DEBUG]: {str(error)}'
+        return self.rule_exception()(msg)
+
     def _explain(self) -> str:
         """
         Rule explanation message
@@ -116,6 +160,7 @@ class _BaseSubject:
     """
 
     _default_args = tuple()  # a default set of positional args for testing
+    _rule_buckets = None
 
     def __init__(self, rules: List[_BaseRule] = None, all_errors=True, custom_error_msg=None):
         """
@@ -131,12 +176,20 @@ class _BaseSubject:
         list of cell errors. Ignores all_errors in that the provided custom_error_msg will still be output for cases
         you wish to entirely override the message when a given field finds an error in one of its rules.
         """
-        self.rules = rules or []
+        self.rules = list(rules or [])  # copied, so the provided list is not changed by this subject
         self.descriptors = {}
         self.include_all_errors = all_errors
         self.custom_error_msg = custom_error_msg
 
-    def _check(self, data, rule_type, **kwargs) -> Union[UrNotMyDataError, List[UrNotMyDataError], None]:
+    def __getstate__(self):
+        # rule buckets hold evaluator functions, which cannot be pickled, and
+        # which would remain bound to the original rules in a copy
+        state = self.__dict__.copy()
+        state.pop('_rule_buckets', None)
+        return state
+
+    def _check(self, data, rule_type, first_error_only=False,
+               **kwargs) -> Union[UrNotMyDataError, List[UrNotMyDataError], None]:
         """
         Check data against specified rule types
 
@@ -148,32 +201,82 @@ class _BaseSubject:
         :param rule_type: a Rule class belonging to one of the submodules in the
             rules module (e.g. rumydata.rules.cell.Rule). This controls the
             types of rules that the provided data will be checked against.
+        :param first_error_only: stop checking rules once one has failed, for
+            callers which only need to know whether the data has any error.
         :return: a list of any errors that were raised while checking the data.
         """
-        errors = []
+        debug = rumydata.exception.debug()  # read once, rather than per exception
         if rule_type:
             try:
                 data = rule_type._pre_process(data, **kwargs)
             except Exception as e:
                 msg = f'raised {e.__class__.__name__} while preprocessing data'
-                if rumydata.exception.debug():
+                if debug:
                     msg += f' [DEBUG]: {str(e)}'
                 return [rumydata.exception.PreProcessingError(msg)]
 
-        for r in self.rules:
+        rules = self._rules_of_type(rule_type)
+        return [
+            rules[i][0]._exception_msg() if e is None else rules[i][0]._raised_exception_msg(e, debug)
+            for i, e in self._failed_rules(data, rules, first_error_only)
+        ]
+
+    @staticmethod
+    def _failed_rules(data, rules, first_error_only=False) -> List[Tuple[int, Union[Exception, None]]]:
+        """
+        Failed rule report
+
+        Evaluate data, which has already been pre-processed, against a list of
+        rules of a single type, as returned by the _rules_of_type method.
+
+        :param data: pre-processed data to evaluate.
+        :param rules: a list of rules, with their prepare method and evaluator.
+        :param first_error_only: stop checking rules once one has failed.
+        :return: a list of tuples of the index of each rule that failed, and the
+            exception that was raised while evaluating the rule, or None if the
+            evaluation of the rule returned False.
+        """
+        failed = []
+        for i, (r, prepare, evaluator) in enumerate(rules):
             # noinspection PyBroadException
             try:
-                if issubclass(type(r), rule_type):
-                    x = r._prepare(data)
-                    e = r._evaluator()(*x)
-                    if not e:
-                        errors.append(r._exception_msg())
-            except Exception as e:  # get type, and rewrite safe message
-                msg = f'raised {e.__class__.__name__} while checking if value {r._explain()}'
-                if rumydata.exception.debug():
-                    msg += f' [DEBUG]: {str(e)}'
-                errors.append(r.rule_exception()(msg))
-        return errors
+                if not (evaluator(*prepare(data)) if prepare else evaluator(data)):
+                    failed.append((i, None))
+            except Exception as e:  # only the type is reported, so drop the traceback and its frames
+                failed.append((i, e.with_traceback(None)))
+            if failed and first_error_only:
+                break
+        return failed
+
+    def _rules_of_type(self, rule_type) -> List[Tuple[_BaseRule, Callable, Callable]]:
+        """
+        Rules of a specified rule type
+
+        Rules are bucketed by rule type on first request, so that a check does
+        not need to test the type of every rule for every value. Each rule is
+        stored alongside its bound prepare method and evaluator function, so
+        that these are looked up once rather than for every value. Rules which
+        use the default prepare method are stored with None in its place, so
+        that the data can be passed directly to the evaluator. A bucket is
+        rebuilt whenever the rules of this subject are no longer the same rule
+        objects that it was made from.
+
+        :param rule_type: a Rule class belonging to one of the submodules in the
+            rules module (e.g. rumydata.rules.cell.Rule).
+        :return: a list of tuples of each rule in this subject of the specified
+            type, with its prepare method and evaluator function.
+        """
+        if self._rule_buckets is None:
+            self._rule_buckets = {}
+        rules = tuple(self.rules)  # rules do not define equality, so are compared by identity
+        bucket = self._rule_buckets.get(rule_type)
+        if bucket is None or bucket[0] != rules:
+            bucket = rules, [
+                (r, None if type(r)._prepare is _BaseRule._prepare else r._prepare, r._cached_evaluator)
+                for r in rules if isinstance(r, rule_type)
+            ]
+            self._rule_buckets[rule_type] = bucket
+        return bucket[1]
 
     def _list_errors(self, value, **kwargs) -> List[UrNotMyDataError]:
         """
@@ -202,7 +305,8 @@ class _BaseSubject:
             returned in the nested structure when checking the provided value.
         """
         # errors must be checked by name since they are generated dynamically for each rule and
-        return error.__name__ in [type(x).__name__ for x in self._list_errors(value, **kwargs)]
+        name = error.__name__
+        return any(type(x).__name__ == name for x in self._flatten_exceptions(self._check(value, **kwargs)))
 
     def _digest(self) -> List[str]:
         """
@@ -236,10 +340,13 @@ class _BaseSubject:
         This method provides a way to easily search a nested tree of errors for
         a specific error. Essentially, iterates through a list of errors,
         checking to see if any of those errors contain additional errors, then
-        continuing to recurse until all errors have been yielded.
+        continuing until all errors have been yielded. An explicit stack is used
+        in place of recursion, so that errors are yielded in the same depth-first
+        order without creating a generator for each nested error.
         """
-        yield error
-        if error is not None:
-            for el in error._errors:
-                for x in cls._flatten_exceptions(el):
-                    yield x
+        stack = [error]
+        while stack:
+            error = stack.pop()
+            yield error
+            if error is not None:
+                stack.extend(reversed(error._errors))
@@ -62,11 +62,16 @@ class UrNotMyDataError(Exception):
     """
 
     _message: str = None
+    _display_name = 'UrNotMyData'  # class name without the Error suffix
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._display_name = cls.__name__[:-5]
 
     def __init__(self, msg: str = None, errors: list = None):
         super().__init__(msg)
         self._message = msg or self._message
-        self._errors = errors or []
+        self._errors = errors or ()  # shared empty tuple, rather than a new list per error
 
     def __str__(self) -> str:
         """
@@ -86,7 +91,8 @@ class UrNotMyDataError(Exception):
 
         This method returns the complete tree of nested exceptions that exist in
         the errors property of this class in Markdown format, with indentation
-        provided to indicate the relationship of nested exceptions.
+        provided to indicate the relationship of nested exceptions. The tree is
+        walked with an explicit stack, and the lines are joined once at the end.
 
         :param depth: an integer which indicates the level of indentation that
             an exception needs to represent its relationship in the nested
@@ -95,23 +101,23 @@ class UrNotMyDataError(Exception):
             indentation providing visual indicator of nested structure.
         """
 
-        txt = f'{"  " * depth} - {self.__class__.__name__[:-5]}: {self._message}'
-        if self._errors:
-            txt = '\n'.join([txt] + [x for x in self._flatten_md(self._errors, depth)])
-        return txt
+        lines = []
+        stack = [(self, depth)]
+        while stack:
+            error, depth = stack.pop()
+            lines.append(error._md_line(depth))
+            stack.extend((x, depth + 1) for x in reversed(error._errors))
+        return '\n'.join(lines)
 
-    @classmethod
-    def _flatten_md(cls, errors, depth=0):
+    def _md_line(self, depth=0) -> str:
         """
-        Nested exception Markdown generator
+        Exception Markdown line
 
-        Recurse through nested exceptions and continue to yield exceptions until
-        exhausted.
-        """
+        The line which represents this exception alone in the Markdown digest.
 
-        depth += 1
-        for el in errors:
-            yield el._md(depth)
+        :param depth: the level of indentation of this exception.
+        """
+        return f'{"  " * depth} - {self._display_name}: {self._message}'
 
 
 class CustomError(UrNotMyDataError):
@@ -119,25 +125,8 @@ class CustomError(UrNotMyDataError):
         super().__init__(msg)
         self._message = msg or self._message
 
-    def _md(self, depth=0) -> str:
-        """
-        Nested exception Markdown digest
-
-        This method returns the complete tree of nested exceptions that exist in
-        the errors property of this class in Markdown format, with indentation
-        provided to indicate the relationship of nested exceptions.
-
-        :param depth: an integer which indicates the level of indentation that
-            an exception needs to represent its relationship in the nested
-            structure. Do not call directly.
-        :return: a string of nested exceptions in Markdown format, with
-            indentation providing visual indicator of nested structure.
-        """
-
-        txt = f'{"  " * depth} - {self._message}'
-        if self._errors:
-            txt = '\n'.join([txt] + [x for x in self._flatten_md(self._errors, depth)])
-        return txt
+    def _md_line(self, depth=0) -> str:
+        return f'{"  " * depth} - {self._message}'
 
 
 class FileError(UrNotMyDataError):
@@ -150,9 +139,7 @@ class FileError(UrNotMyDataError):
     """
 
     def __init__(self, file, msg=None, errors: list = None):
-        message = file
-        message += f'; {msg}' if msg else ''
-        super().__init__(message, errors)
+        super().__init__(f'{file}; {msg}' if msg else file, errors)
 
 
 class ColumnError(UrNotMyDataError):
@@ -164,14 +151,11 @@ class ColumnError(UrNotMyDataError):
     """
 
     def __init__(self, index: int, msg=None, errors: list = None, **kwargs):
-        message = ''
-        offset = 0 if kwargs.get("zero_index") else 1
-
-        message += f'{str(index + offset)}'
-        if kwargs.get("name"):
-            message += f' ({kwargs.get("name")})'
-        message += f'; {msg}' if msg else ''
-        super().__init__(message, errors)
+        offset = 0 if kwargs.get('zero_index') else 1
+        name = kwargs.get('name')
+        name = f' ({name})' if name else ''
+        msg = f'; {msg}' if msg else ''
+        super().__init__(f'{index + offset}{name}{msg}', errors)
 
 
 class RowError(UrNotMyDataError):
@@ -188,9 +172,9 @@ class RowError(UrNotMyDataError):
     """
 
     def __init__(self, index: int, msg=None, errors: list = None, **kwargs):
-        message = f'{str(index + (0 if kwargs.get("zero_index") else 1))}'
-        message += f'; {msg}' if msg else ''
-        super().__init__(message, errors)
+        offset = 0 if kwargs.get('zero_index') else 1
+        msg = f'; {msg}' if msg else ''
+        super().__init__(f'{index + offset}{msg}', errors)
 
 
 class CellError(UrNotMyDataError):
@@ -207,21 +191,16 @@ class CellError(UrNotMyDataError):
     """
 
     def __init__(self, index: int, msg=None, errors: list = None, use_excel_cell_format=False, **kwargs):
-        message = ''
-        offset = 0 if kwargs.get("zero_index") else 1
+        offset = 0 if kwargs.get('zero_index') else 1
+        rix, name = kwargs.get('rix'), kwargs.get('name')
         if use_excel_cell_format:
-            message = f'{str(convert_to_excel_col_labels(index + offset))}'
-            if kwargs.get('rix') is not None:
-                message += str(kwargs.get('rix') + offset)
+            position = convert_to_excel_col_labels(index + offset)
+            position += '' if rix is None else f'{rix + offset}'
         else:
-            if kwargs.get('rix') is not None:
-                message = str(kwargs.get('rix') + offset) + ','
-            message += f'{str(index + offset)}'
-
-        if kwargs.get("name"):
-            message += f' ({kwargs.get("name")})'
-        message += f'; {msg}' if msg else ''
-        super().__init__(message, errors)
+            position = f'{index + offset}' if rix is None else f'{rix + offset},{index + offset}'
+        name = f' ({name})' if name else ''
+        msg = f'; {msg}' if msg else ''
+        super().__init__(f'{position}{name}{msg}', errors)
 
 
 class PreProcessingError(UrNotMyDataError):
@@ -22,6 +22,12 @@ from rumydata.rules import cell as clr, column as cr
 
 __all__ = ['Text', 'Date', 'Currency', 'Digit', 'Integer', 'Choice', 'Ignore', 'Empty']
 
+# rules without arguments are stateless, so a single instance is shared by all fields
+_not_null = clr.NotNull()
+_only_numbers = clr.OnlyNumbers()
+_can_be_integer = clr.CanBeInteger()
+_no_leading_zero = clr.NoLeadingZero()
+
 
 class Field(_BaseSubject):
     """
@@ -39,6 +45,11 @@ class Field(_BaseSubject):
         prior to checking rules.
     """
 
+    _cell_cache = None  # cell results by value, only kept while a file is checked
+    _cell_cache_size = 4096  # maximum number of distinct values to cache results for
+    _cell_cache_hits = 0
+    _cell_cache_for = None
+
     def __init__(self, nullable=False, rules: list = None, **kwargs):
         self.strip = kwargs.pop('strip', None)
         self._ignore_if = None
@@ -46,7 +57,7 @@ class Field(_BaseSubject):
         self.nullable = nullable
 
         if not self.nullable:
-            self.rules.append(clr.NotNull())
+            self.rules.append(_not_null)
 
     def check_cell(self, value: Union[str, Tuple[str, Dict]], **kwargs):
         """
@@ -61,7 +72,8 @@ class Field(_BaseSubject):
         """
 
         errors = self._check(value, rule_type=clr.Rule, **kwargs)
-        assert not errors, str(errors)
+        if errors:
+            raise AssertionError(str(errors))
 
     def check_column(self, values: List[str], **kwargs):
         """
@@ -75,15 +87,16 @@ class Field(_BaseSubject):
         """
 
         errors = self._check(values, rule_type=cr.Rule, **kwargs)
-        assert not errors, str(errors)
+        if errors:
+            raise AssertionError(str(errors))
 
     def _check_for_nullable_rules(self):
-        return any([x for x in self.rules if isinstance(x, clr.NotNullIfCompare)])
+        return bool(self._rules_of_type(clr.NotNullIfCompare))
 
     def _check_nullable_rule_results(self, data):
-        return all([x._null_ok(data) for x in self.rules if isinstance(x, clr.NotNullIfCompare)])
+        return all([r._null_ok(data) for r, _, _ in self._rules_of_type(clr.NotNullIfCompare)])
 
-    def _check(self, data, cix=-1, rule_type=None, **kwargs) -> Union[ex.CellError, ex.ColumnError, None]:
+    def _check(self, data, cix=-1, rule_type=clr.Rule, **kwargs) -> Union[ex.CellError, ex.ColumnError, None]:
         """
         Check data against field rules of specified rule type
 
@@ -99,16 +112,26 @@ class Field(_BaseSubject):
         :return: a list of any errors that were raised while checking the data.
         """
 
+        # cell values may come with a dictionary of comparison values
+        value, compare = data if isinstance(data, tuple) else (data, None)
+        cell_rules = rule_type is clr.Rule
+
         # if data is nullable and value is empty, skip all checks
-        empty = data[0] == '' if isinstance(data, tuple) else data == ''
-        if self.nullable and rule_type == clr.Rule and empty:
+        empty = value == ''
+        if empty and self.nullable and cell_rules:
             pass
-        elif empty and (self._check_nullable_rule_results(data) if self._check_for_nullable_rules() else False):
+        elif empty and self._check_for_nullable_rules() and self._check_nullable_rule_results(data):
             pass
         else:
-            e = super()._check(data, rule_type=rule_type, strip=self.strip)
+            if cell_rules and not compare and self._cell_cache is not None and not ex.debug():
+                e = self._check_cell_value(value)
+            else:
+                e = super()._check(
+                    data, rule_type=rule_type, strip=self.strip,
+                    first_error_only=cell_rules and not self.include_all_errors
+                )
             if e:
-                if rule_type == cr.Rule:
+                if rule_type is cr.Rule:
                     return ex.ColumnError(cix, errors=e, **kwargs)
                 else:
                     if self.include_all_errors:
@@ -121,6 +144,68 @@ class Field(_BaseSubject):
                         else:
                             return ex.CellError(cix, **kwargs)
 
+    def _check_cell_value(self, value: str) -> list:
+        """
+        Cached cell rule check
+
+        Check a single cell value from a file, which has no comparison values,
+        against the cell rules of this field. The rules which failed are cached
+        by value, so that values which are repeated throughout a column (e.g.
+        categories, or common dates) are only evaluated once, and new errors are
+        generated for every check. The cache is cleared when it is full, or when
+        the rules or settings of this field have changed. If fewer than half of
+        the values checked while filling the cache were repeats, caching is
+        switched off until the next file check, since mostly distinct values
+        would only be stored and never reused.
+
+        :param value: a cell value to be checked
+        :return: a list of any errors that were raised while checking the value.
+        """
+        rules = self._rules_of_type(clr.Rule)
+        settings = rules, self.strip, self.include_all_errors
+        cached_for = self._cell_cache_for
+        if cached_for is None or cached_for[0] is not rules or cached_for[1:] != settings[1:]:
+            self._cell_cache.clear()
+            self._cell_cache_hits = 0
+            self._cell_cache_for = settings
+
+        cache = self._cell_cache
+        try:
+            failed = cache[value]
+        except KeyError:
+            data = clr.Rule._pre_process(value, strip=self.strip)  # values read from a file are always strings
+            failed = self._failed_rules(data, rules, not self.include_all_errors)
+            if len(cache) >= self._cell_cache_size:
+                if self._cell_cache_hits < len(cache):
+                    self._release_cell_cache()  # later checks of this file are not cached
+                cache.clear()
+                self._cell_cache_hits = 0
+            cache[value] = failed
+        else:
+            self._cell_cache_hits += 1
+
+        return [
+            rules[i][0]._exception_msg() if e is None else rules[i][0]._raised_exception_msg(e)
+            for i, e in failed
+        ]
+
+    def _start_cell_cache(self):
+        """ Start caching cell results by value """
+        self._cell_cache = {}
+        self._cell_cache_hits = 0
+        self._cell_cache_for = None
+
+    def _release_cell_cache(self):
+        """ Discard cached cell results, and stop caching them """
+        self._cell_cache = None
+        self._cell_cache_for = None
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        for k in ('_cell_cache', '_cell_cache_hits', '_cell_cache_for'):
+            state.pop(k, None)
+        return state
+
     def _comparison_columns(self) -> set:
         """
         Comparison fields report
@@ -132,12 +217,12 @@ class Field(_BaseSubject):
         """
         compares = set()
         for r in self.rules:
-            if issubclass(type(r), clr.ColumnComparisonRule):
-                compares.add(r.compare_to) if isinstance(r.compare_to, str) else [compares.add(x) for x in r.compare_to]
+            if isinstance(r, clr.ColumnComparisonRule):
+                compares.update((r.compare_to,) if isinstance(r.compare_to, str) else r.compare_to)
         return compares
 
     def _has_rule_type(self, rule_type):
-        return any([issubclass(type(r), rule_type) for r in self.rules])
+        return any(isinstance(r, rule_type) for r in self.rules)
 
     def _digest(self):
         dig = super()._digest()
@@ -194,12 +279,12 @@ class Text(Field):
         super().__init__(**kwargs)
 
         self.descriptors['Type'] = 'String'
-        self.descriptors['Max Length'] = f'{str(max_length)} characters'
+        self.descriptors['Max Length'] = f'{max_length} characters'
 
         self.rules.append(clr.MaxChar(max_length))
 
         if min_length:
-            self.descriptors['Min Length'] = f'{str(min_length)} characters'
+            self.descriptors['Min Length'] = f'{min_length} characters'
             self.rules.append(clr.MinChar(min_length))
 
 
@@ -255,7 +340,7 @@ class Currency(Field):
         self.descriptors['Type'] = 'Numeric'
         self.descriptors['Format'] = \
             f'{"9" * (significant_digits - precision)}.{"9" * precision}'
-        self.descriptors['Max Length'] = f'{str(significant_digits)} digits'
+        self.descriptors['Max Length'] = f'{significant_digits} digits'
         self.rules.append(clr.MaxDigit(significant_digits))
         self.rules.append(clr.NumericDecimals(precision))
 
@@ -278,14 +363,14 @@ class Digit(Field):
         super().__init__(**kwargs)
 
         self.descriptors['Type'] = 'Numeric'
-        self.descriptors['Format'] = f'{"0" * max_length}'
-        self.descriptors['Max Length'] = f'{str(max_length)} digits'
+        self.descriptors['Format'] = '0' * max_length
+        self.descriptors['Max Length'] = f'{max_length} digits'
 
-        self.rules.append(clr.OnlyNumbers())
+        self.rules.append(_only_numbers)
         self.rules.append(clr.MaxChar(max_length))
 
         if min_length:
-            self.descriptors['Min Length'] = f'{str(min_length)} digits'
+            self.descriptors['Min Length'] = f'{min_length} digits'
             self.rules.append(clr.MinChar(min_length))
 
 
@@ -305,15 +390,15 @@ class Integer(Field):
         super().__init__(**kwargs)
 
         self.descriptors['Type'] = 'Numeric'
-        self.descriptors['Format'] = f'{"9" * max_length}'
-        self.descriptors['Max Length'] = f'{str(max_length)} digits'
+        self.descriptors['Format'] = '9' * max_length
+        self.descriptors['Max Length'] = f'{max_length} digits'
 
-        self.rules.append(clr.CanBeInteger())
-        self.rules.append(clr.NoLeadingZero())
+        self.rules.append(_can_be_integer)
+        self.rules.append(_no_leading_zero)
         self.rules.append(clr.MaxDigit(max_length))
 
         if min_length:
-            self.descriptors['Min Length'] = f'{str(max_length)} digits'
+            self.descriptors['Min Length'] = f'{min_length} digits'
             self.rules.append(clr.MinDigit(min_length))
 
 
@@ -2,17 +2,18 @@ import webbrowser
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from time import sleep
-from typing import Tuple
+from typing import Tuple, TYPE_CHECKING
 from warnings import warn
 
-from rumydata.table import Layout, CsvFile
+if TYPE_CHECKING:  # the table submodule is only imported once a file is checked
+    from rumydata.table import Layout
 
 __all__ = ['menu']
 
 _format_options = {'markdown': 'md', 'html': 'html'}
 
 
-def menu(layout: Layout) -> dict:
+def menu(layout: 'Layout') -> dict:
     """
     Layout menu
 
@@ -42,17 +43,17 @@ def menu(layout: Layout) -> dict:
     return choice[0](layout, **choice[1])
 
 
-def _documentation(layout: Layout, ext: str = None, output: str = None) -> dict:
+def _documentation(layout: 'Layout', ext: str = None, output: str = None) -> dict:
     """ Run Layout documentation through menu """
     return _doc_out(*_doc_gen(layout, ext), output)
 
 
-def _validation(layout: Layout, ext: str = None, output: str = None) -> dict:
+def _validation(layout: 'Layout', ext: str = None, output: str = None) -> dict:
     """ Run validation result through menu """
     return _doc_out(*_file_check(layout, ext), output)
 
 
-def _file_check(layout: Layout, ext) -> Tuple[str, str]:
+def _file_check(layout: 'Layout', ext) -> Tuple[str, str]:
     """ Perform a check of a csv file with (mostly) default params """
     if not ext:
         print("How to format the documentation?")
@@ -65,13 +66,15 @@ def _file_check(layout: Layout, ext) -> Tuple[str, str]:
             warn('markdown module not available; falling back to raw md')
             ext = 'md'
 
+    from rumydata.table import CsvFile
+
     p = input('What is the file path to validate?\n > ')
     errors = CsvFile(layout).check(p, doc_type=ext)
     if errors:
         return errors, ext
 
 
-def _doc_gen(layout: Layout, extension: str = None) -> Tuple[str, str]:
+def _doc_gen(layout: 'Layout', extension: str = None) -> Tuple[str, str]:
     """ Generate documentation from a layout """
 
     if not extension:
@@ -12,6 +12,7 @@ the constructor of the classes in the field submodule.
 """
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Union, Tuple, Dict, List
 
 from rumydata._base import _BaseRule
@@ -30,6 +31,32 @@ __all__ = [
 ]
 
 
+class _DigitTable(dict):
+    """
+    Translation table which removes every character that is not a digit
+
+    Used with str.translate to strip formatting from numeric strings. Entries
+    are added as each character is first encountered, rather than building a
+    table for every unicode character up front.
+    """
+
+    def __missing__(self, key):
+        self[key] = key if chr(key).isdecimal() else None
+        return self[key]
+
+
+_digits_only = _DigitTable()
+
+# loose patterns which accept every value that int(), float() or the ISO date
+# format could accept, so that most invalid values are rejected without raising
+_int_like = re.compile(r'\s*[+-]?\d[\d_]*\s*')
+_float_like = re.compile(
+    r'\s*[+-]?(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:e[+-]?\d[\d_]*)?\s*|\s*[+-]?(?:inf|infinity|nan)\s*',
+    re.IGNORECASE
+)
+_date_iso_like = re.compile(r'\d{4}-\d{1,2}-[ \d]?\d')
+
+
 class Rule(_BaseRule):
     """ Cell Rule """
 
@@ -164,10 +191,14 @@ class Choice(Rule):
     _default_args = (['x'],)
 
     def __init__(self, choices: List[str], case_insensitive=False):
+        if not choices:
+            raise ValueError("choices argument invalid. Must contain at least one value")
+        if not all(isinstance(x, str) for x in choices):
+            raise TypeError("choices argument invalid. All values must be strings")
         super().__init__()
         self.choices = choices
         self.case_insensitive = case_insensitive
-        self.eval_choices = [x.lower() for x in choices] if case_insensitive else choices
+        self.eval_choices = frozenset(x.lower() for x in choices) if case_insensitive else frozenset(choices)
 
     def _prepare(self, data: Union[List[str], Tuple[str, Dict]]) -> tuple:
         if self.case_insensitive:
@@ -203,7 +234,7 @@ class MinDigit(Rule):
         self.min_length = min_length
 
     def _evaluator(self):
-        return lambda x: len(re.sub(r'[^\d]', '', x)) >= self.min_length
+        return lambda x: len(x.translate(_digits_only)) >= self.min_length
 
     def _explain(self) -> str:
         return f'must have at least {str(self.min_length)} digit characters'
@@ -224,7 +255,7 @@ class MaxDigit(Rule):
         self.max_length = max_length
 
     def _evaluator(self):
-        return lambda x: len(re.sub(r'[^\d]', '', x)) <= self.max_length
+        return lambda x: len(x.translate(_digits_only)) <= self.max_length
 
     def _explain(self) -> str:
         return f'must have no more than {self.max_length} digit characters'
@@ -234,7 +265,7 @@ class OnlyNumbers(Rule):
     """ Cell only digit characters Rule """
 
     def _evaluator(self):
-        return lambda x: bool(re.fullmatch(r'\d+', x))
+        return lambda x: x.isdecimal()  # same characters as a full match of \d+
 
     def _explain(self) -> str:
         return 'must only contain characters 0-9'
@@ -249,7 +280,11 @@ class NoLeadingZero(Rule):
     """
 
     def _evaluator(self):
-        return lambda x: bool(re.fullmatch(r'(0|([1-9]\d*))', re.sub(r'[^\d]', '', x)))
+        def func(x):
+            x = x.translate(_digits_only)
+            return x == '0' or '1' <= x[:1] <= '9'
+
+        return func
 
     def _explain(self) -> str:
         return 'cannot have a leading zero digit'
@@ -259,7 +294,11 @@ class CanBeFloat(Rule):
     """ Cell can be float Rule """
 
     def _evaluator(self):
+        match = _float_like.fullmatch
+
         def fun(x):
+            if not match(x):
+                return False
             try:
                 return isinstance(float(x), float)
             except ValueError:
@@ -275,7 +314,11 @@ class CanBeInteger(Rule):
     """ Cell can be integer Rule """
 
     def _evaluator(self):
+        match = _int_like.fullmatch
+
         def fun(x):
+            if not match(x):
+                return False
             try:
                 return isinstance(int(x), int)
             except ValueError:
@@ -287,16 +330,25 @@ class CanBeInteger(Rule):
         return 'can be coerced into an integer value'
 
 
+@lru_cache(maxsize=32)
+def _decimals_pattern(decimals: int) -> re.Pattern:
+    """ Compile the pattern for a maximum number of decimals, once for each """
+    if decimals:
+        return re.compile(r'-?\d+(\.\d{1,' + str(decimals) + '})?')
+    return re.compile(r'-?\d+')
+
+
 class NumericDecimals(Rule):
     """ Cell has maximum decimals Rule """
 
     def __init__(self, max_decimals=2):
         super().__init__()
+        if max_decimals < 0:
+            raise ValueError("max_decimals argument invalid. Must not be negative")
         self.decimals = max_decimals
 
     def _evaluator(self):
-        pat = re.compile(r'-?\d+(\.\d{1,' + str(self.decimals) + '})?')
-        return lambda x: bool(pat.fullmatch(x))
+        return lambda x: bool(_decimals_pattern(self.decimals).fullmatch(x))
 
     def _explain(self) -> str:
         return f'cannot have more than {self.decimals} digits after the decimal point'
@@ -424,6 +476,40 @@ class NumericLT(NumericComparison):
         return lambda x: float(x) < self.comparison_value
 
 
+def _iso_date(x: str) -> datetime:
+    """
+    Parse a YYYY-MM-DD date
+
+    Values in the fixed ISO-8601 layout, with ASCII digits, are parsed by
+    slicing, which avoids the format interpretation done by strptime for every
+    value. Any other value is passed to strptime, so that the same values are
+    accepted or rejected.
+    """
+    digits = x[:4] + x[5:7] + x[8:]
+    if len(x) == 10 and x[4] == '-' and x[7] == '-' and digits.isascii() and digits.isdigit():
+        return datetime(int(x[:4]), int(x[5:7]), int(x[8:]))
+    return datetime.strptime(x, '%Y-%m-%d')
+
+
+def _parse_date(x: str, date_format: str) -> datetime:
+    """ Parse a date with a date format """
+    if date_format == '%Y-%m-%d':
+        return _iso_date(x)
+    return datetime.strptime(x, date_format)
+
+
+@lru_cache(maxsize=256)
+def _comparison_date(value: str, date_format: str) -> datetime:
+    """ Parse a comparison date, once for each distinct value and format """
+    return _parse_date(value, date_format)
+
+
+@lru_cache(maxsize=256)
+def _iso_string(value: datetime) -> str:
+    """ Format a comparison date as YYYY-MM-DD, once for each distinct value """
+    return f'{value.year:04d}-{value.month:02d}-{value.day:02d}'
+
+
 class DateRule(Rule):
     """ Base date Rule """
 
@@ -446,9 +532,13 @@ class CanBeDateIso(DateRule):
     """ Can be ISO-8601 date Rule """
 
     def _evaluator(self):
+        match = _date_iso_like.fullmatch
+
         def func(x):
+            if not match(x):
+                return False
             try:
-                return isinstance(datetime.strptime(x, '%Y-%m-%d'), datetime)
+                return isinstance(_iso_date(x), datetime)
             except ValueError:
                 return False
 
@@ -471,7 +561,7 @@ class DateComparisonRule(DateRule):
 
     def __init__(self, comparison_value, date_format='%Y-%m-%d', **kwargs):
         self.date_format = date_format
-        self.comparison_value = datetime.strptime(comparison_value, date_format)
+        self.comparison_value = _comparison_date(comparison_value, date_format)
         super().__init__(**kwargs)
 
     def _explain(self) -> str:
@@ -486,7 +576,7 @@ class DateGT(DateComparisonRule):
     def _evaluator(self):
         def func(x):
             try:
-                return datetime.strptime(x, self.date_format) > self.comparison_value
+                return _parse_date(x, self.date_format) > self.comparison_value
             except ValueError:
                 return False
 
@@ -501,7 +591,7 @@ class DateGTE(DateComparisonRule):
     def _evaluator(self):
         def func(x):
             try:
-                return datetime.strptime(x, self.date_format) >= self.comparison_value
+                return _parse_date(x, self.date_format) >= self.comparison_value
             except ValueError:
                 return False
 
@@ -515,8 +605,10 @@ class DateET(DateComparisonRule):
 
     def _evaluator(self):
         def func(x):
+            if self.date_format == '%Y-%m-%d' and x == _iso_string(self.comparison_value):
+                return True  # an exact string match is equal without parsing
             try:
-                return datetime.strptime(x, self.date_format) == self.comparison_value
+                return _parse_date(x, self.date_format) == self.comparison_value
             except ValueError:
                 return False
 
@@ -531,7 +623,7 @@ class DateLTE(DateComparisonRule):
     def _evaluator(self):
         def func(x):
             try:
-                return datetime.strptime(x, self.date_format) <= self.comparison_value
+                return _parse_date(x, self.date_format) <= self.comparison_value
             except ValueError:
                 return False
 
@@ -546,7 +638,7 @@ class DateLT(DateComparisonRule):
     def _evaluator(self):
         def func(x):
             try:
-                return datetime.strptime(x, self.date_format) < self.comparison_value
+                return _parse_date(x, self.date_format) < self.comparison_value
             except ValueError:
                 return False
 
@@ -34,21 +34,17 @@ class Rule(_BaseRule):
             data = [d.strip() for d in data]
         return data
 
-    def _prepare(self, data: List[str]) -> tuple:
-        return data,
-
 
 class Unique(Rule):
-    """ Column values unique Rule """
+    """
+    Column values unique Rule
 
-    def _prepare(self, data: List[str]) -> tuple:
-        return [x for x in data if not x == ''],
+    Blank values are excluded by counting them, rather than by building a
+    filtered copy of the column, so that the column is only deduplicated once.
+    """
 
     def _evaluator(self):
-        return lambda x: len(x) == len(set(x))
-
-    def _exception_msg(self):
-        return self.rule_exception()(self._explain())
+        return lambda x: len(x) - x.count('') == len(set(x).difference(('',)))
 
     def _explain(self):
         return 'values must be unique'
@@ -6,17 +6,12 @@ used directly. They accomplish things like ensuring that the entire row contains
 the expected number of values, before attempting to validate individual cells.
 """
 
-from typing import List
-
 from rumydata._base import _BaseRule
 
 
 class Rule(_BaseRule):
     """ Row Rule """
 
-    def _prepare(self, data: List[str]) -> tuple:
-        return data,
-
 
 class RowLengthLTE(Rule):
     """ Row length less than or equal to Rule """
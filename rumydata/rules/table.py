@@ -5,8 +5,8 @@ These rules are applied to entire files and are generally not meant to be used
 directly. These accomplish things like confirming a file exists, that it matches
 a particular regex pattern, etc.
 """
+import re
 from pathlib import Path
-from typing import Union
 
 from rumydata._base import _BaseRule
 
@@ -14,9 +14,6 @@ from rumydata._base import _BaseRule
 class Rule(_BaseRule):
     """ File Rule """
 
-    def _prepare(self, data: Union[str, Path]) -> tuple:
-        return data,
-
 
 class FileExists(Rule):
     """ File exists Rule """
@@ -38,8 +35,7 @@ class FileNameMatch(Rule):
         self.pattern = pattern
 
     def _evaluator(self):
-        import re
-        return lambda x: re.fullmatch(self.pattern, x.name, re.IGNORECASE)
+        return lambda x: re.fullmatch(self.pattern, x.name, re.IGNORECASE)  # compiled once by the re cache
 
     def _explain(self) -> str:
         # TODO come up with a better way to make a 'human readable' error message for bad file name in regards to a regex pattern....
@@ -4,6 +4,7 @@ table submodule
 This submodule contains the File class, and it's closely related Layout class.
 """
 import csv
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Union, Dict, List, Iterable
 from uuid import uuid4
@@ -106,7 +107,8 @@ class Layout(_BaseSubject):
             in the file. Defaults to 0.
         """
         errors = self._check(row, rule_type=hr.Rule, rix=rix)
-        assert not errors, str(errors)
+        if errors:
+            raise AssertionError(str(errors))
 
     def check_row(self, row: List[str], rix=-1):
         """
@@ -120,7 +122,8 @@ class Layout(_BaseSubject):
         :param rix: row index number. Used to report position of row in file.
         """
         errors = self._check(row, rule_type=rr.Rule, rix=rix)
-        assert not errors, str(errors)
+        if errors:
+            raise AssertionError(str(errors))
 
     def _markdown_digest(self) -> str:
         """
@@ -131,15 +134,30 @@ class Layout(_BaseSubject):
 
         :return: a Markdown formatted string describing the layout
         """
-        fields = f'# {self._title}' + '\n\n' if self._title else ''
-        fields += '\n'.join([
-            f' - **{k}**' + ''.join(['\n   - ' + x for x in v._digest()])
-            for k, v in self.layout.items()
+        fields = f'# {self._title}\n\n' if self._title else ''
+        return fields + '\n'.join([
+            '\n   - '.join([f' - **{k}**', *v._digest()]) for k, v in self.layout.items()
         ])
-        return fields
+
+    @contextmanager
+    def _cached_cells(self):
+        """
+        Cache cell results of each field while a file is checked
+
+        Caches are only kept for the duration of a file check, since they hold
+        raw values from the file, and are discarded when the check ends, even if
+        it raises.
+        """
+        for f in self.layout.values():
+            f._start_cell_cache()
+        try:
+            yield
+        finally:
+            for f in self.layout.values():  # including any Empty fields added by the check
+                f._release_cell_cache()
 
     def _check(self, row, rule_type, rix=None) -> Union[ex.UrNotMyDataError, None]:
-        if rule_type == hr.Rule and self.skip_header:
+        if rule_type is hr.Rule and self.skip_header:
             return
 
         e = super()._check(row, rule_type=rule_type)
@@ -147,7 +165,7 @@ class Layout(_BaseSubject):
         if e:  # if row errors are found, skip cell checks
             return ex.RowError(rix or -1, errors=e)
 
-        if rule_type == rr.Rule:
+        if rule_type is rr.Rule:
             row = dict(zip(self.layout.keys(), row))
             # if any of the fields are Ignore, or if the field uses the _ignore_if parameter and the value matches the
             # specified value we ignore them. Handles cases where a string or list is specified
@@ -224,9 +242,11 @@ class _BaseFile(_BaseSubject):
         :param doc_type: the type of output to return with exception details,
             rather than raising an exception. Valid options are ['md', 'html']
         """
-        errors = self._check(Path(file_path))
+        with self.layout._cached_cells():
+            errors = self._check(Path(file_path))
         try:
-            assert not errors, str(errors)
+            if errors:
+                raise AssertionError(str(errors))
             msg = f"Validated file successfully: {Path(file_path).as_posix()}"
         except AssertionError as ae:
             if not doc_type:
@@ -348,13 +368,15 @@ class CsvFile(_BaseFile):
     :param dialect: (optional) Controls csv dialect parsing.
     :param delimiter: (optional) Controls csv delimiter parsing.
     :param quotechar: (optional) Controls csv quote character parsing.
+    :param buffering: (optional) Size in bytes of the buffer used to read the
+        file. Defaults to 64 KiB.
     """
 
     def __init__(self, layout: Union[Layout, dict], skip_rows=0, max_errors=100, **kwargs):
         x = {x: kwargs.pop(x, None) for x in ['dialect', 'delimiter', 'quotechar']}
         self.csv_kwargs = {k: v for k, v in x.items() if v}
 
-        y = {y: kwargs.pop(y, None) for y in ['newline', 'encoding', 'errors']}
+        y = {y: kwargs.pop(y, None) for y in ['newline', 'encoding', 'errors', 'buffering']}
         self.file_kwargs = {k: v for k, v in y.items() if v}
 
         super().__init__(layout, skip_rows, max_errors, **kwargs)
@@ -366,6 +388,8 @@ class CsvFile(_BaseFile):
                 self.csv_kwargs = csv_kwargs
                 self.file_kwargs = file_kwargs
                 self.file_kwargs['newline'] = self.file_kwargs.get('newline', '')
+                # read the file in large blocks, rather than the default buffer size
+                self.file_kwargs['buffering'] = self.file_kwargs.get('buffering', 1 << 16)
 
             def __enter__(self) -> Iterable:
                 self.file_object = self.file_path.open(**self.file_kwargs)
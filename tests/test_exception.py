@@ -31,3 +31,8 @@ def test_custom_error():
     x._errors = [ex.CellError(0)]
     print(x._md())
     assert x._md() == " - Testing\n   - Cell: 1"
+
+
+def test_nested_md():
+    x = ex.RowError(0, errors=[ex.CellError(0, errors=[ex.CustomError('a')]), ex.CellError(1)])
+    assert x._md() == " - Row: 1\n   - Cell: 1\n     - a\n   - Cell: 2"
@@ -315,8 +315,106 @@ def test_no_errors():
     assert len(field.Text(1, all_errors=True)._list_errors('', rule_type=rules.cell.Rule)) > 1
 
 
+def test_no_errors_stops_at_first():
+    calls = []
+    first = rules.cell.make_static_cell_rule(lambda x: calls.append(1) and False, 'first')
+    second = rules.cell.make_static_cell_rule(lambda x: calls.append(2) and False, 'second')
+    assert field.Field(rules=[first, second], all_errors=False)._check('x')
+    assert calls == [1]
+    calls.clear()
+    assert field.Field(rules=[first, second], all_errors=True)._check('x')
+    assert calls == [1, 2]
+
+
+def test_no_errors_column_rules_all_reported():
+    class Fail(rules.column.Rule):
+        def _explain(self):
+            return 'always fails'
+
+    fo = field.Field(rules=[rules.column.Unique(), Fail()], all_errors=False)
+    assert len(fo._check(['1', '1'], rule_type=rules.column.Rule)._errors) == 2
+
+
 def test_custom_message_override():
     assert not len(field.Text(1, custom_error_msg='CustomErrorMessage', all_errors=False)._list_errors('',
                                                                                                        rule_type=rules.cell.Rule)) > 2
     assert len(field.Text(1, custom_error_msg='CustomErrorMessage', all_errors=True)._list_errors('',
                                                                                                   rule_type=rules.cell.Rule)) > 2
+
+
+def test_integer_min_length_descriptor():
+    assert field.Integer(5, min_length=2).descriptors['Min Length'] == '2 digits'
+
+
+def test_rule_changes_detected():
+    fo = field.Text(3)
+    assert not fo._check('xx')
+    fo.rules[1] = rules.cell.MaxChar(1)
+    assert fo._has_error('xx', rules.cell.MaxChar.rule_exception())
+    assert 'must be no more than 1 characters' in fo._digest()
+    del fo.rules[1]
+    assert not fo._check('xx')
+
+
+def test_rules_list_copied():
+    provided = [rules.cell.MaxChar(1)]
+    fo = field.Text(3, rules=provided)
+    provided.clear()
+    assert fo._has_error('xx', rules.cell.MaxChar.rule_exception())
+
+
+def test_field_subclass_without_init():
+    class Bare(field.Field):
+        # noinspection PyMissingConstructor
+        def __init__(self):
+            self.nullable = False
+            self.strip = None
+            self.include_all_errors = True
+            self.custom_error_msg = None
+            self.rules = [rules.cell.MaxChar(1)]
+
+    fo = Bare()
+    assert fo._has_error('xx', rules.cell.MaxChar.rule_exception())
+    fo._start_cell_cache()
+    assert fo._has_error('xx', rules.cell.MaxChar.rule_exception())
+
+
+def test_cell_results_cached():
+    calls = []
+    rule = rules.cell.make_static_cell_rule(lambda x: calls.append(x) or x == 'a', 'must be a')
+    fo = field.Field(rules=[rule])
+    assert fo._cell_cache is None  # only cached while a file is checked
+    fo._start_cell_cache()
+    for value in ['a', 'b', 'a', 'b', 'a']:
+        fo._check(value, rule_type=rules.cell.Rule)
+    assert calls == ['a', 'b']
+    first, second = fo._check('b')._errors[0], fo._check('b')._errors[0]
+    assert first is not second
+    assert type(first) is type(second) is rule.rule_exception()
+    assert not fo._has_error('a', rule.rule_exception())
+
+
+def test_cell_cache_follows_settings():
+    fo = field.Text(3)
+    fo._start_cell_cache()
+    assert fo._check('abc ')
+    fo.strip = True
+    assert not fo._check('abc ')
+    fo.rules.append(rules.cell.MinChar(4))
+    assert len(fo._check_cell_value('')) == 2
+    fo.include_all_errors = False
+    assert len(fo._check_cell_value('')) == 1
+
+
+def test_cell_cache_high_cardinality():
+    fo = field.Integer(6)
+    fo._cell_cache_size = 100
+    fo._start_cell_cache()
+    for value in range(1000):  # distinct values switch caching off once the cache fills
+        fo._check(str(value))
+    assert fo._cell_cache is None
+    assert fo._has_error('a', rules.cell.CanBeInteger.rule_exception())
+    fo._start_cell_cache()
+    for value in range(1000):  # repeated values keep caching, within the cache size
+        fo._check(str(value // 3))
+    assert 0 < len(fo._cell_cache) <= 100
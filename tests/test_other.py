@@ -4,6 +4,8 @@ sensible scripts.
 """
 
 import csv
+import subprocess
+import sys
 import uuid
 from pathlib import Path
 from textwrap import dedent
@@ -373,3 +375,14 @@ def test_complex_bad(bad_complex_file):
 ])
 def test_excel_cell_formatter(value, expected_output):
     assert ex.convert_to_excel_col_labels(value) == expected_output
+
+
+def test_lazy_package_attributes():
+    """ Submodules and objects are available from a fresh import of the package """
+    code = (
+        'import rumydata; '
+        'assert rumydata.table.Layout is rumydata.Layout; '
+        'assert rumydata.field.Text and rumydata.rules.cell and rumydata.exception.debug; '
+        'assert not {"_lazy", "_import_module"} & set(dir(rumydata))'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
@@ -1,7 +1,13 @@
+import copy
+import gc
+import pickle
+import weakref
+
 import pytest
 
-from rumydata._base import _BaseRule
+from rumydata._base import _BaseRule, _BaseSubject
 from rumydata.exception import UrNotMyDataError
+from rumydata.rules.cell import MaxChar
 
 
 def recurse_subclasses(class_to_recurse):
@@ -43,3 +49,66 @@ def test_base_prepare():
     r = _BaseRule()._prepare('x')
     assert isinstance(r, tuple)
     assert r[0] == 'x'
+
+
+def test_cached_evaluator():
+    r = _BaseRule()
+    assert r._cached_evaluator is r._cached_evaluator
+
+
+@pytest.mark.parametrize('rule', recurse_subclasses(_BaseRule))
+def test_rule_exception_reused(rule):
+    """ Rule exception classes are generated once per rule class """
+    assert rule.rule_exception() is rule.rule_exception()
+
+
+def test_rule_exception_per_class():
+    class Sub(_BaseRule):
+        pass
+
+    assert _BaseRule.rule_exception() is not Sub.rule_exception()
+    assert Sub.rule_exception().__name__ == 'SubError'
+
+
+def test_rule_exception_not_kept_alive():
+    class Temporary(_BaseRule):
+        pass
+
+    Temporary.rule_exception()
+    ref = weakref.ref(Temporary)
+    del Temporary
+    gc.collect()
+    assert ref() is None
+
+
+def test_copied_rule_rebuilds_evaluator():
+    r = MaxChar(3)
+    assert not r._cached_evaluator('abcd')
+    for copied in (pickle.loads(pickle.dumps(r)), copy.deepcopy(r)):
+        copied.max_length = 5
+        assert copied._cached_evaluator('abcd')
+    assert not r._cached_evaluator('abcd')
+
+
+def test_flatten_exceptions_order():
+    leaves = [UrNotMyDataError('a'), UrNotMyDataError('b')]
+    branch = UrNotMyDataError('branch', errors=leaves)
+    root = UrNotMyDataError('root', errors=[branch, UrNotMyDataError('c')])
+    flat = [x._message for x in _BaseSubject._flatten_exceptions(root)]
+    assert flat == ['root', 'branch', 'a', 'b', 'c']
+
+
+def test_flatten_exceptions_none():
+    assert list(_BaseSubject._flatten_exceptions(None)) == [None]
+
+
+def test_exception_msg_new_instance():
+    r = _BaseRule()
+    assert r._exception_msg() is not r._exception_msg()
+    assert type(r._exception_msg()) is type(r._exception_msg())
+
+
+def test_exception_msg_follows_explain(mocker):
+    r = _BaseRule()
+    mocker.patch.object(r, '_explain', return_value='changed explanation')
+    assert r._exception_msg()._message == 'changed explanation'
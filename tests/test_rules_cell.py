@@ -117,7 +117,9 @@ def test_min_digit(value: str, expected: bool, length: int):
     (2, 'aa1', True),
     (0, 'a', True),  # if no digits are required, 'a' is valid
     (1, '1a', True),
-    (2, '111a', False)
+    (2, '111a', False),
+    (3, '$1,234', False),
+    (2, '\u0661\u0662', True)
 ])
 def test_max_digit(value: str, expected: bool, length: int):
     r = MaxDigit(length)
@@ -127,7 +129,9 @@ def test_max_digit(value: str, expected: bool, length: int):
 @pytest.mark.parametrize('value,expected', [
     ('123', True),
     ('123a', False),
-    ('12.3', False)
+    ('12.3', False),
+    ('', False),
+    ('\u0661\u0662', True)
 ])
 def test_only_numbers(value: str, expected: bool):
     r = OnlyNumbers()
@@ -138,7 +142,10 @@ def test_only_numbers(value: str, expected: bool):
     ('0123', False),
     ('1023', True),
     ('0', True),
-    ('0.0', False)
+    ('0.0', False),
+    ('$1,023.00', True),
+    ('', False),
+    ('\u0661\u0662', False)
 ])
 def test_no_leading_zero(value: str, expected: bool):
     r = NoLeadingZero()
@@ -149,6 +156,12 @@ def test_no_leading_zero(value: str, expected: bool):
     ('1', True),
     ('0', True),
     ('a', False),
+    ('-1.5e-3', True),
+    ('.5', True),
+    (' 1_000 ', True),
+    ('-inf', True),
+    ('1.2.3', False),
+    ('', False),
 ])
 def test_can_be_float(value: str, expected: bool):
     r = CanBeFloat()
@@ -160,7 +173,11 @@ def test_can_be_float(value: str, expected: bool):
     ('0', True),
     ('0.0', False),
     ('0.1', False),
-    ('a', False)
+    ('a', False),
+    ('-1', True),
+    (' 1_000 ', True),
+    ('1__0', False),
+    ('', False)
 ])
 def test_can_be_integer(value: str, expected: bool):
     r = CanBeInteger()
@@ -172,13 +189,25 @@ def test_can_be_integer(value: str, expected: bool):
     (1, '123', True),
     (1, '0123', True),  # combine with NoLeadingZero to prevent this
     (1, '1.00', False),
-    (2, '1.00', True)
+    (2, '1.00', True),
+    (0, '123', True),
+    (0, '1.0', False)
 ])
 def test_numeric_decimals(decimals: int, value: str, expected: bool):
     r = NumericDecimals(decimals)
     assert r._evaluator()(*r._prepare(value)) is expected
 
 
+@pytest.mark.parametrize('rule,args,error', [
+    (NumericDecimals, (-1,), ValueError),
+    (Choice, ([],), ValueError),
+    (Choice, (['x', 1],), TypeError)
+])
+def test_invalid_rule_args(rule, args, error):
+    with pytest.raises(error):
+        rule(*args)
+
+
 @pytest.mark.parametrize('comparison,value,expected', [
     (1, 'x', False),
     (1, 'xx', True),
@@ -302,6 +331,10 @@ def test_numeric_lt(comparison: float, value: str, expected: bool):
     ('19010101', False, {}),
     ('9999-99-99', False, {}),
     ('2020-13-01', False, {}),
+    ('2020-02-30', False, {}),
+    ('0000-01-01', False, {}),
+    ('2020-1-1', True, {}),
+    ('\u0662\u0660\u0662\u0660-\u0660\u0661-\u0660\u0661', False, {}),
     ('2020-01-01', True, dict(truncate_time=True)),
     ('2020-01-01 00:00:00', True, dict(truncate_time=True)),
     (('2020-01-01 00:00:00', {}), True, dict(truncate_time=True)),
@@ -316,7 +349,8 @@ def test_can_be_date_iso(value: str, expected: bool, kwargs: dict):
     ('2020-01-01', '2020-01-01', False),
     ('2020-01-01', '2020-01-02', True),
     ('2020-01-01', '2020-01-32', False),
-    ('2020-01-01', '2019-12-31', False)
+    ('2020-01-01', '2019-12-31', False),
+    ('2020-01-01', '\u0662\u0660\u0662\u0660-\u0660\u0661-\u0660\u0662', False)
 ])
 def test_date_gt(comparison: str, value: str, expected: bool):
     r = DateGT(comparison)
@@ -338,13 +372,23 @@ def test_date_gte(comparison: str, value: str, expected: bool):
     ('2020-01-01', '2020-01-01', True),
     ('2020-01-01', '2020-01-02', False),
     ('2020-01-01', '2020-01-32', False),
-    ('2020-01-01', '2019-12-31', False)
+    ('2020-01-01', '2019-12-31', False),
+    ('2020-01-01', '\u0662\u0660\u0662\u0660-\u0660\u0661-\u0660\u0661', False)
 ])
 def test_date_et(comparison: str, value: str, expected: bool):
     r = DateET(comparison)
     assert r._evaluator()(*r._prepare(value)) is expected
 
 
+@pytest.mark.parametrize('comparison,value,expected', [
+    ('2020-02-01', '2020-02-01', True),
+    ('2020-02-01', '2020-01-02', False)
+])
+def test_date_et_format(comparison: str, value: str, expected: bool):
+    r = DateET(comparison, date_format='%Y-%d-%m')
+    assert r._evaluator()(*r._prepare(value)) is expected
+
+
 @pytest.mark.parametrize('comparison,value,expected', [
     ('2020-01-01', '2020-01-01', True),
     ('2020-01-01', '2020-01-02', False),
@@ -475,3 +519,22 @@ def test_other_must_exist_if_equals(row, other, values, expected):
 def test_non_trim(value, expected):
     r = NonTrim()
     assert r._evaluator()(*r._prepare(value)) is expected
+
+
+@pytest.mark.parametrize('rule,attribute,changed,value', [
+    (MaxChar(3), 'max_length', 5, 'abcd'),
+    (MinChar(5), 'min_length', 3, 'abcd'),
+    (MaxDigit(3), 'max_length', 5, '1234'),
+    (LengthLT(3), 'comparison_value', 5, 'abcd'),
+    (NumericGT(5), 'comparison_value', 3, '4'),
+    (NumericDecimals(1), 'decimals', 2, '1.23'),
+    (Choice(['a']), 'eval_choices', frozenset(['b']), 'b'),
+    (DateGT('2020-01-01'), 'comparison_value', DateGT('2019-01-01').comparison_value, '2019-06-01'),
+    (DateET('2020-01-01'), 'comparison_value', DateET('2019-01-01').comparison_value, '2019-01-01')
+])
+def test_evaluator_follows_attributes(rule, attribute, changed, value):
+    """ Changes to rule attributes apply to an evaluator that was already built """
+    evaluator = rule._cached_evaluator
+    assert not evaluator(*rule._prepare(value))
+    setattr(rule, attribute, changed)
+    assert evaluator(*rule._prepare(value))
@@ -30,7 +30,9 @@ def test_rule_prepare(rule):
     (['1', '2', '3'], True),
     (['1', '1', '3'], False),
     (['', '', '1'], True),
-    (['', '1', '1'], False)
+    (['', '1', '1'], False),
+    (['', ''], True),
+    ([], True)
 ])
 def test_unique(value: list, expected: bool):
     r = Unique()
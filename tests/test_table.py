@@ -1,3 +1,5 @@
+import copy
+import pickle
 from pathlib import Path
 from uuid import uuid4
 
@@ -129,6 +131,16 @@ def test_file_name_match(tmpdir):
     assert not CsvFile(layout, file_name_pattern=pattern).check(mock_file)
 
 
+def test_file_name_match_pattern_changed(tmpdir):
+    mock_file = Path(tmpdir, 'report.csv')
+    mock_file.write_text('x\n1\n')
+    cf = CsvFile(Layout({'x': Integer(1)}), file_name_pattern='other.csv')
+    with pytest.raises(AssertionError):
+        cf.check(mock_file)
+    cf.rules[-1].pattern = 'report.csv'
+    assert not cf.check(mock_file)
+
+
 def test_excel_cell_format():
     lay = Layout({'col_a': Text(1)}, use_excel_cell_format=True)
     try:
@@ -279,3 +291,40 @@ def test_bom_sig(tmpdir, write, read, expect_pass):
     else:
         with pytest.raises(AssertionError):
             cf.check(p)
+
+
+def test_checked_layout_pickle_and_deepcopy(tmpdir):
+    p = Path(tmpdir, uuid4().hex[:5])
+    p.write_text('\n'.join(['a,b'] + ['x,1'] * 10 + ['xx,1']))
+    layout = Layout({'a': Text(1), 'b': Integer(1)})
+    with pytest.raises(AssertionError):
+        CsvFile(layout).check(p)
+    for copied in (pickle.loads(pickle.dumps(layout)), copy.deepcopy(layout)):
+        with pytest.raises(AssertionError):
+            CsvFile(copied).check(p)
+        copied.layout['a'].rules[-1].max_length = 2  # changes to a copy only apply to that copy
+        assert not CsvFile(copied).check(p)
+    with pytest.raises(AssertionError):
+        CsvFile(layout).check(p)
+
+
+@pytest.mark.parametrize("buffering", [None, 16, 1 << 20])
+def test_csv_buffering(tmpdir, buffering):
+    p = Path(tmpdir, uuid4().hex[:5])
+    p.write_text('\n'.join(['column'] + ['data'] * 100))
+    layout = Layout({'column': Text(4)})
+    kwargs = dict(buffering=buffering) if buffering else {}
+    assert not CsvFile(layout, **kwargs).check(p)
+
+
+def test_layout_all_errors_false_reports_every_header_error():
+    lay = Layout({'a': Text(1), 'b': Text(1)}, all_errors=False)
+    assert lay._has_error(['b', 'a', 'a'], rules.header.NoDuplicate.rule_exception(), rule_type=rules.header.Rule)
+
+
+def test_cell_cache_released_after_check(tmpdir):
+    p = Path(tmpdir, uuid4().hex[:5])
+    p.write_text('\n'.join(['a,b'] + ['x,1'] * 10))
+    layout = Layout({'a': Text(1), 'b': Integer(1)})
+    assert not CsvFile(layout).check(p)
+    assert all(not f._cell_cache for f in layout.layout.values())